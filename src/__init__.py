@@ -1,26 +1,42 @@
 """
 Pipeline de datos de Spotify usando Apache Kafka
 """
+from importlib import import_module
 
 __version__ = "1.0.0"
 __author__ = "Sebastian Pasar"
 __description__ = "Pipeline de datos de Spotify usando Apache Kafka"
 
-# Importaciones del productor
-from .kafka_producer_spotify.config import config
-from .kafka_producer_spotify.models import SpotifyTrack, SpotifyCountryStats, SpotifyMessage
-from .kafka_producer_spotify.spotify_client import SpotifyClientFactory
-from .kafka_producer_spotify.kafka_producer import KafkaProducerFactory
-from .kafka_producer_spotify.producer_orchestrator import SpotifyProducerOrchestrator
-from .kafka_producer_spotify.main import SpotifyProducerApp
+# Re-exportaciones del productor, resueltas bajo demanda (PEP 562) para
+# que importar `src` no arrastre pydantic, kafka-python y aiohttp
+_EXPORTS = {
+    "config": "kafka_producer_spotify.config",
+    "SpotifyTrack": "kafka_producer_spotify.models",
+    "SpotifyCountryStats": "kafka_producer_spotify.models",
+    "SpotifyMessage": "kafka_producer_spotify.models",
+    "SpotifyClientFactory": "kafka_producer_spotify.spotify_client",
+    "KafkaProducerFactory": "kafka_producer_spotify.kafka_producer",
+    "SpotifyProducerOrchestrator": "kafka_producer_spotify.producer_orchestrator",
+    "SpotifyProducerApp": "kafka_producer_spotify.main",
+}
 
 __all__ = [
     "config",
     "SpotifyTrack",
-    "SpotifyCountryStats", 
+    "SpotifyCountryStats",
     "SpotifyMessage",
     "SpotifyClientFactory",
     "KafkaProducerFactory",
     "SpotifyProducerOrchestrator",
     "SpotifyProducerApp"
 ]
+
+
+def __getattr__(name: str):
+    """Import perezoso de los símbolos exportados"""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cachear para accesos posteriores
+    return value
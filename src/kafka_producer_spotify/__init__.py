@@ -1,25 +1,43 @@
 """
 Productor de estadísticas de Spotify para Apache Kafka
 """
+from importlib import import_module
 
 __version__ = "1.0.0"
 __author__ = "Sebastian Pasar"
 __description__ = "Productor de datos de Spotify para Apache Kafka"
 
-from .config import config
-from .models import SpotifyTrack, SpotifyCountryStats, SpotifyMessage
-from .spotify_client import SpotifyClientFactory
-from .kafka_producer import KafkaProducerFactory
-from .producer_orchestrator import SpotifyProducerOrchestrator
-from .main import SpotifyProducerApp
+# Mapa de nombre exportado -> submódulo que lo define. Los imports se
+# resuelven bajo demanda (PEP 562) para no pagar la construcción de
+# Settings y de todos los modelos en el arranque del CLI.
+_EXPORTS = {
+    "config": "config",
+    "SpotifyTrack": "models",
+    "SpotifyCountryStats": "models",
+    "SpotifyMessage": "models",
+    "SpotifyClientFactory": "spotify_client",
+    "KafkaProducerFactory": "kafka_producer",
+    "SpotifyProducerOrchestrator": "producer_orchestrator",
+    "SpotifyProducerApp": "main",
+}
 
 __all__ = [
     "config",
     "SpotifyTrack",
-    "SpotifyCountryStats", 
+    "SpotifyCountryStats",
     "SpotifyMessage",
     "SpotifyClientFactory",
     "KafkaProducerFactory",
     "SpotifyProducerOrchestrator",
     "SpotifyProducerApp"
 ]
+
+
+def __getattr__(name: str):
+    """Import perezoso de los símbolos exportados"""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cachear para accesos posteriores
+    return value
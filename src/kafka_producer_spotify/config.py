@@ -9,6 +9,13 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Países por defecto para procesar (conjunto fijo y pequeño)
+DEFAULT_COUNTRIES = (
+    "US", "GB", "CA", "AU", "DE", "FR", "ES", "IT",
+    "BR", "MX", "AR", "CO", "CL", "PE", "JP", "KR",
+    "IN", "SE", "NO"
+)
+
 
 class Settings(BaseSettings):
     """Configuración de la aplicación usando Pydantic"""
@@ -16,6 +23,8 @@ class Settings(BaseSettings):
     # Spotify API
     spotify_client_id: str = Field(..., env="SPOTIFY_CLIENT_ID")
     spotify_client_secret: str = Field(..., env="SPOTIFY_CLIENT_SECRET")
+    # Requests por segundo permitidos contra la API de Spotify
+    spotify_rate_limit: int = Field(default=10, env="SPOTIFY_RATE_LIMIT")
     
     # Kafka
     kafka_bootstrap_servers: str = Field(default="localhost:9092", env="KAFKA_BOOTSTRAP_SERVERS")
@@ -24,6 +33,9 @@ class Settings(BaseSettings):
     # Producer
     fetch_interval_minutes: int = Field(default=60, env="FETCH_INTERVAL_MINUTES")
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    # Modo rápido: sin LoggingObserver y con métricas de solo contadores
+    silent_observers: bool = Field(default=False, env="SILENT_OBSERVERS")
+    fast_metrics: bool = Field(default=False, env="FAST_METRICS")
     
     class Config:
         env_file = ".env"
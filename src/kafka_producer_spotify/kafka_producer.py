@@ -1,8 +1,13 @@
 """
 Productor de Kafka usando patrón Observer y Template Method
 """
-import json
+import queue
+import threading
 import uuid
+import zlib
+from functools import partial
+
+import msgspec.json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from kafka import KafkaProducer
@@ -10,7 +15,19 @@ from kafka.errors import KafkaError
 from loguru import logger
 
 from .models import SpotifyMessage, SpotifyCountryStats
-from .config import config
+from .config import config, DEFAULT_COUNTRIES
+
+# Índice de cada país dentro del bitmask de métricas; el bit 63 agrupa
+# cualquier código fuera del conjunto conocido
+_CC_INDEX = {cc: i for i, cc in enumerate(DEFAULT_COUNTRIES)}
+
+# Cache de claves de partición: los códigos de país son un conjunto
+# pequeño y fijo, no hace falta re-codificarlos en cada envío
+_KEY_CACHE: Dict[str, bytes] = {}
+
+# Encoder compartido (thread-safe): evita recrear el estado del
+# serializador en cada mensaje
+_ENCODER = msgspec.json.Encoder()
 
 
 class MessageObserver(ABC):
@@ -31,40 +48,51 @@ class LoggingObserver(MessageObserver):
     """Observer que registra eventos en logs"""
     
     def on_message_sent(self, message: SpotifyMessage, metadata: Dict[str, Any]) -> None:
-        logger.info(
-            f"Mensaje enviado exitosamente - País: {message.country_stats.country_code}, "
-            f"Tracks: {message.country_stats.total_tracks}, "
-            f"Partition: {metadata.get('partition')}, "
-            f"Offset: {metadata.get('offset')}"
+        # Evaluación perezosa: los atributos solo se recorren si algún
+        # sink acepta el nivel INFO
+        logger.opt(lazy=True).info(
+            "Mensaje enviado exitosamente - País: {}, Tracks: {}, Partition: {}, Offset: {}",
+            lambda: message.country_stats.country_code,
+            lambda: message.country_stats.total_tracks,
+            lambda: metadata.get('partition'),
+            lambda: metadata.get('offset')
         )
-    
+
     def on_message_failed(self, message: SpotifyMessage, error: Exception) -> None:
-        logger.error(
-            f"Error enviando mensaje - País: {message.country_stats.country_code}, "
-            f"Error: {str(error)}"
+        logger.opt(lazy=True).error(
+            "Error enviando mensaje - País: {}, Error: {}",
+            lambda: message.country_stats.country_code,
+            lambda: str(error)
         )
 
 
 class MetricsObserver(MessageObserver):
     """Observer que recolecta métricas"""
-    
-    def __init__(self):
+
+    def __init__(self, fast_metrics: bool = False):
+        # fast_metrics: solo incrementa contadores, sin tocar atributos
+        # del mensaje en el camino caliente
+        self.fast_metrics = fast_metrics
         self.messages_sent = 0
         self.messages_failed = 0
-        self.countries_processed = set()
-    
+        # Bitmask indexado por posición en DEFAULT_COUNTRIES: marcar un
+        # país es un OR de enteros en lugar de hash/resize de un set
+        self._cc_mask = 0
+
     def on_message_sent(self, message: SpotifyMessage, metadata: Dict[str, Any]) -> None:
         self.messages_sent += 1
-        self.countries_processed.add(message.country_stats.country_code)
-    
+        if self.fast_metrics:
+            return
+        self._cc_mask |= 1 << _CC_INDEX.get(message.country_stats.country_code, 63)
+
     def on_message_failed(self, message: SpotifyMessage, error: Exception) -> None:
         self.messages_failed += 1
-    
+
     def get_metrics(self) -> Dict[str, Any]:
         return {
             "messages_sent": self.messages_sent,
             "messages_failed": self.messages_failed,
-            "countries_processed": len(self.countries_processed),
+            "countries_processed": self._cc_mask.bit_count(),
             "success_rate": self.messages_sent / (self.messages_sent + self.messages_failed) if (self.messages_sent + self.messages_failed) > 0 else 0
         }
 
@@ -76,33 +104,78 @@ class BaseKafkaProducer(ABC):
         self.bootstrap_servers = bootstrap_servers
         self.topic = topic
         self.observers: List[MessageObserver] = []
+        # Snapshot inmutable para iterar en el camino caliente sin pagar
+        # la contabilidad de la lista; se reconstruye en add/remove
+        self._observers_tuple: tuple = ()
         self._producer: Optional[KafkaProducer] = None
+        # Los callbacks de kafka-python corren en su thread sender; encolar
+        # la notificación y despacharla en un thread dedicado evita que el
+        # formateo de logs/metricas bloquee el I/O del productor.
+        # send() en sí es thread-safe según kafka-python.
+        self._notify_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._notify_thread: Optional[threading.Thread] = None
+        # Partición destino por país, calculada una vez: colisionar
+        # intencionalmente en pocas particiones permite que linger.ms
+        # compacte los envíos del lote por broker
+        self._partition_cache: Dict[str, int] = {}
     
     def add_observer(self, observer: MessageObserver) -> None:
         """Agrega un observer"""
         self.observers.append(observer)
-    
+        self._observers_tuple = tuple(self.observers)
+
     def remove_observer(self, observer: MessageObserver) -> None:
         """Remueve un observer"""
         if observer in self.observers:
             self.observers.remove(observer)
-    
+            self._observers_tuple = tuple(self.observers)
+
     def _notify_message_sent(self, message: SpotifyMessage, metadata: Dict[str, Any]) -> None:
         """Notifica a todos los observers que un mensaje fue enviado"""
-        for observer in self.observers:
+        observers = self._observers_tuple
+        if not observers:
+            return
+        for observer in observers:
             try:
                 observer.on_message_sent(message, metadata)
             except Exception as e:
                 logger.error(f"Error en observer: {e}")
-    
+
     def _notify_message_failed(self, message: SpotifyMessage, error: Exception) -> None:
         """Notifica a todos los observers que falló el envío"""
-        for observer in self.observers:
+        observers = self._observers_tuple
+        if not observers:
+            return
+        for observer in observers:
             try:
                 observer.on_message_failed(message, error)
             except Exception as e:
                 logger.error(f"Error en observer: {e}")
     
+    def _on_send_success(self, message: SpotifyMessage, metadata: Any) -> None:
+        """Callback de éxito del envío (invocado por el thread sender de kafka-python)"""
+        self._notify_queue.put(('sent', message, {
+            'partition': metadata.partition,
+            'offset': metadata.offset,
+            'timestamp': metadata.timestamp
+        }))
+
+    def _on_send_error(self, message: SpotifyMessage, error: Exception) -> None:
+        """Callback de fallo del envío (invocado por el thread sender de kafka-python)"""
+        self._notify_queue.put(('failed', message, error))
+
+    def _drain_notifications(self) -> None:
+        """Loop del thread que despacha notificaciones a los observers"""
+        while True:
+            item = self._notify_queue.get()
+            if item is None:  # Sentinela de cierre
+                break
+            kind, message, payload = item
+            if kind == 'sent':
+                self._notify_message_sent(message, payload)
+            else:
+                self._notify_message_failed(message, payload)
+
     @abstractmethod
     def _create_producer(self) -> KafkaProducer:
         """Crea la instancia del productor de Kafka"""
@@ -114,13 +187,19 @@ class BaseKafkaProducer(ABC):
         pass
     
     def _serialize_message(self, message: SpotifyMessage) -> bytes:
-        """Serializa el mensaje a JSON bytes"""
-        return json.dumps(message.dict(), ensure_ascii=False, default=str).encode('utf-8')
+        """Serializa el mensaje a JSON bytes usando msgspec (serializador en C)"""
+        return _ENCODER.encode(message)
     
     def connect(self) -> None:
         """Conecta al cluster de Kafka"""
         try:
             self._producer = self._create_producer()
+            self._notify_thread = threading.Thread(
+                target=self._drain_notifications,
+                name="kafka-producer-notify",
+                daemon=True
+            )
+            self._notify_thread.start()
             logger.info(f"Conectado a Kafka: {self.bootstrap_servers}")
         except Exception as e:
             logger.error(f"Error conectando a Kafka: {e}")
@@ -129,43 +208,75 @@ class BaseKafkaProducer(ABC):
     def disconnect(self) -> None:
         """Desconecta del cluster de Kafka"""
         if self._producer:
+            self._producer.flush()
             self._producer.close()
             self._producer = None
             logger.info("Desconectado de Kafka")
+        if self._notify_thread:
+            self._notify_queue.put(None)
+            self._notify_thread.join(timeout=5)
+            self._notify_thread = None
     
+    def _partition_for(self, country_code: str, key: bytes) -> Optional[int]:
+        """Resuelve la partición determinística de un país (memoizada)"""
+        partition = self._partition_cache.get(country_code)
+        if partition is None:
+            partitions = self._producer.partitions_for(self.topic)
+            if not partitions:
+                return None  # Dejar que decida el particionador por defecto
+            # crc32 es estable entre procesos (hash() de str no lo es)
+            ordered = sorted(partitions)
+            partition = ordered[zlib.crc32(key) % len(ordered)]
+            self._partition_cache[country_code] = partition
+        return partition
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Drena el buffer interno del productor (un solo flush por lote)"""
+        if self._producer:
+            self._producer.flush(timeout=timeout)
+
+    def build_payload(self, country_stats: SpotifyCountryStats) -> tuple:
+        """
+        Construye (country_code, key, value, message) sin tocar el productor.
+        La serialización ocurre aquí, fuera del lock del accumulator, para
+        que submit_payload solo haga la copia al buffer interno.
+        """
+        message = self._prepare_message(country_stats)
+        serialized_message = self._serialize_message(message)
+
+        country_code = country_stats.country_code
+        key = _KEY_CACHE.get(country_code)
+        if key is None:
+            key = _KEY_CACHE[country_code] = country_code.encode('utf-8')
+
+        return (country_code, key, serialized_message, message)
+
+    def submit_payload(self, payload: tuple) -> None:
+        """Entrega un payload pre-serializado al productor"""
+        if not self._producer:
+            raise RuntimeError("Productor no conectado. Llama connect() primero.")
+
+        country_code, key, serialized_message, message = payload
+
+        future = self._producer.send(
+            self.topic,
+            value=serialized_message,
+            key=key,
+            partition=self._partition_for(country_code, key)
+        )
+
+        # Callbacks compartidos (métodos + partial) en lugar de closures
+        # nuevos por envío
+        future.add_callback(partial(self._on_send_success, message))
+        future.add_errback(partial(self._on_send_error, message))
+
     def send_country_stats(self, country_stats: SpotifyCountryStats) -> None:
         """Template method para enviar estadísticas de un país"""
         if not self._producer:
             raise RuntimeError("Productor no conectado. Llama connect() primero.")
-        
+
         try:
-            # Preparar mensaje
-            message = self._prepare_message(country_stats)
-            
-            # Serializar
-            serialized_message = self._serialize_message(message)
-            
-            # Enviar
-            future = self._producer.send(
-                self.topic,
-                value=serialized_message,
-                key=country_stats.country_code.encode('utf-8')
-            )
-            
-            # Callback para manejar resultado
-            def on_success(metadata):
-                self._notify_message_sent(message, {
-                    'partition': metadata.partition,
-                    'offset': metadata.offset,
-                    'timestamp': metadata.timestamp
-                })
-            
-            def on_error(error):
-                self._notify_message_failed(message, error)
-            
-            future.add_callback(on_success)
-            future.add_errback(on_error)
-            
+            self.submit_payload(self.build_payload(country_stats))
         except Exception as e:
             logger.error(f"Error enviando mensaje: {e}")
             raise
@@ -173,7 +284,19 @@ class BaseKafkaProducer(ABC):
 
 class SpotifyKafkaProducer(BaseKafkaProducer):
     """Implementación concreta del productor para datos de Spotify"""
-    
+
+    def __init__(self, bootstrap_servers: str, topic: str):
+        super().__init__(bootstrap_servers, topic)
+        # producer_info es invariante entre envíos: se construye y
+        # serializa una sola vez en lugar de por mensaje
+        self._producer_info: Dict[str, Any] = {
+            "producer_type": "spotify_stats_producer",
+            "version": "1.0.0",
+            "kafka_topic": topic,
+            "bootstrap_servers": bootstrap_servers
+        }
+        self._producer_info_bytes: bytes = _ENCODER.encode(self._producer_info)
+
     def _create_producer(self) -> KafkaProducer:
         """Crea el productor de Kafka con configuración específica"""
         return KafkaProducer(
@@ -181,23 +304,37 @@ class SpotifyKafkaProducer(BaseKafkaProducer):
             value_serializer=lambda x: x,  # Ya serializamos manualmente
             key_serializer=lambda x: x,    # Ya serializamos manualmente
             acks='all',  # Esperar confirmación de todas las réplicas
-            retries=3,
+            # Idempotencia: permite mantener 5 requests en vuelo con
+            # reintentos ilimitados sin duplicados ni reordenamientos
+            enable_idempotence=True,
+            retries=2147483647,
             retry_backoff_ms=1000,
             request_timeout_ms=30000,
-            compression_type='gzip'
+            compression_type='lz4',  # Más rápido que gzip para payloads JSON
+            # Batching: acumular mensajes hasta 100ms / 1MB para agrupar
+            # los envíos por país en pocos requests de Produce
+            linger_ms=100,
+            batch_size=1048576,
+            buffer_memory=33554432,
+            max_in_flight_requests_per_connection=5
         )
     
     def _prepare_message(self, country_stats: SpotifyCountryStats) -> SpotifyMessage:
         """Prepara el mensaje con información adicional del productor"""
         return SpotifyMessage(
-            message_id=str(uuid.uuid4()),
+            # .hex evita el formateo con guiones de str(uuid4())
+            message_id=uuid.uuid4().hex,
             country_stats=country_stats,
-            producer_info={
-                "producer_type": "spotify_stats_producer",
-                "version": "1.0.0",
-                "kafka_topic": self.topic,
-                "bootstrap_servers": self.bootstrap_servers
-            }
+            producer_info=self._producer_info
+        )
+
+    def _serialize_message(self, message: SpotifyMessage) -> bytes:
+        """Serializa concatenando el fragmento precalculado de producer_info"""
+        return (
+            b'{"message_id":"' + message.message_id.encode('utf-8')
+            + b'","country_stats":' + _ENCODER.encode(message.country_stats)
+            + b',"producer_info":' + self._producer_info_bytes
+            + b'}'
         )
 
 
@@ -212,8 +349,10 @@ class KafkaProducerFactory:
             topic=config.kafka_topic
         )
         
-        # Agregar observers por defecto
-        producer.add_observer(LoggingObserver())
-        producer.add_observer(MetricsObserver())
-        
+        # Agregar observers por defecto; en producción silenciosa se omite
+        # el observer de logging por completo
+        if not config.silent_observers:
+            producer.add_observer(LoggingObserver())
+        producer.add_observer(MetricsObserver(fast_metrics=config.fast_metrics))
+
         return producer
@@ -3,9 +3,8 @@ Aplicación principal del productor de Spotify
 """
 import signal
 import sys
-import time
+import threading
 from typing import Optional
-import schedule
 from loguru import logger
 
 from .producer_orchestrator import SpotifyProducerOrchestrator
@@ -18,6 +17,7 @@ class SpotifyProducerApp:
     def __init__(self):
         self.orchestrator: Optional[SpotifyProducerOrchestrator] = None
         self.running = False
+        self._stop_event = threading.Event()
         self._setup_logging()
         self._setup_signal_handlers()
     
@@ -106,26 +106,22 @@ class SpotifyProducerApp:
         if not self.orchestrator:
             raise RuntimeError("Aplicación no inicializada")
         
-        # Configurar schedule
-        schedule.every(config.fetch_interval_minutes).minutes.do(self._scheduled_job)
-        
+        interval_seconds = config.fetch_interval_minutes * 60
         logger.info(f"Scheduler configurado para ejecutar cada {config.fetch_interval_minutes} minutos")
-        
-        # Ejecutar job inicial
-        logger.info("Ejecutando job inicial...")
-        self._scheduled_job()
-        
-        # Loop principal del scheduler
+
         self.running = True
         logger.info("Iniciando loop del scheduler...")
-        
+
+        # El proceso duerme exactamente hasta la próxima ejecución en lugar
+        # de despertar cada segundo a consultar un schedule pendiente;
+        # stop() despierta el Event inmediatamente
         while self.running:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                self._scheduled_job()
             except Exception as e:
                 logger.error(f"Error en loop del scheduler: {e}")
-                time.sleep(5)  # Esperar antes de reintentar
+            if self._stop_event.wait(interval_seconds):
+                break
     
     def run_once(self) -> None:
         """Ejecuta el procesamiento una sola vez"""
@@ -138,9 +134,10 @@ class SpotifyProducerApp:
     def stop(self) -> None:
         """Detiene la aplicación de forma graceful"""
         logger.info("Deteniendo aplicación...")
-        
+
         self.running = False
-        
+        self._stop_event.set()
+
         if self.orchestrator:
             self.orchestrator.shutdown()
         
@@ -1,39 +1,42 @@
 """
 Modelos de datos para las estadísticas de Spotify
+
+Se usa msgspec.Struct en lugar de pydantic.BaseModel en el camino
+caliente del productor: la construcción no paga validadores por campo
+y la serialización a JSON se resuelve en una sola llamada en C.
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, Any, List, Optional
+
+import msgspec
+from msgspec import Meta
 
 
-class SpotifyTrack(BaseModel):
+class SpotifyTrack(msgspec.Struct):
     """Modelo para una canción de Spotify"""
-    track_id: str = Field(..., description="ID único de la canción")
-    name: str = Field(..., description="Nombre de la canción")
-    artist: str = Field(..., description="Artista principal")
-    album: str = Field(..., description="Nombre del álbum")
-    popularity: int = Field(..., ge=0, le=100, description="Popularidad de 0 a 100")
-    duration_ms: int = Field(..., description="Duración en milisegundos")
-    explicit: bool = Field(..., description="Si la canción es explícita")
-    preview_url: Optional[str] = Field(None, description="URL de preview")
+    track_id: Annotated[str, Meta(description="ID único de la canción")]
+    name: Annotated[str, Meta(description="Nombre de la canción")]
+    artist: Annotated[str, Meta(description="Artista principal")]
+    album: Annotated[str, Meta(description="Nombre del álbum")]
+    popularity: Annotated[int, Meta(ge=0, le=100, description="Popularidad de 0 a 100")]
+    duration_ms: Annotated[int, Meta(description="Duración en milisegundos")]
+    explicit: Annotated[bool, Meta(description="Si la canción es explícita")]
+    preview_url: Annotated[Optional[str], Meta(description="URL de preview")] = None
 
 
-class SpotifyCountryStats(BaseModel):
+class SpotifyCountryStats(msgspec.Struct):
     """Modelo para estadísticas de un país"""
-    country_code: str = Field(..., description="Código ISO del país")
-    country_name: str = Field(..., description="Nombre del país")
-    top_tracks: List[SpotifyTrack] = Field(..., description="Top tracks del país")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Timestamp de la consulta")
-    total_tracks: int = Field(..., description="Total de tracks obtenidos")
+    country_code: Annotated[str, Meta(description="Código ISO del país")]
+    country_name: Annotated[str, Meta(description="Nombre del país")]
+    top_tracks: Annotated[List[SpotifyTrack], Meta(description="Top tracks del país")]
+    total_tracks: Annotated[int, Meta(description="Total de tracks obtenidos")]
+    timestamp: Annotated[datetime, Meta(description="Timestamp de la consulta")] = msgspec.field(
+        default_factory=datetime.utcnow
+    )
 
 
-class SpotifyMessage(BaseModel):
+class SpotifyMessage(msgspec.Struct):
     """Modelo para el mensaje que se envía a Kafka"""
-    message_id: str = Field(..., description="ID único del mensaje")
-    country_stats: SpotifyCountryStats = Field(..., description="Estadísticas del país")
-    producer_info: Dict[str, Any] = Field(..., description="Información del productor")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    message_id: Annotated[str, Meta(description="ID único del mensaje")]
+    country_stats: Annotated[SpotifyCountryStats, Meta(description="Estadísticas del país")]
+    producer_info: Annotated[Dict[str, Any], Meta(description="Información del productor")]
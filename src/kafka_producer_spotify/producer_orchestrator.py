@@ -1,15 +1,15 @@
 """
 Orquestador principal del productor usando patrón Command y Facade
 """
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
 
 from .spotify_client import SpotifyClientFactory, SpotifyAPIClient
 from .kafka_producer import KafkaProducerFactory, SpotifyKafkaProducer, MetricsObserver
-from .config import config
+from .config import config, DEFAULT_COUNTRIES
 
 
 class Command(ABC):
@@ -30,14 +30,24 @@ class FetchCountryStatsCommand(Command):
         self.country_code = country_code
     
     def execute(self) -> Dict[str, Any]:
+        """Ejecuta el comando de forma síncrona"""
+        async def _run() -> Dict[str, Any]:
+            try:
+                return await self.execute_async()
+            finally:
+                await self.spotify_client.aclose()
+
+        return asyncio.run(_run())
+
+    async def execute_async(self) -> Dict[str, Any]:
         """Ejecuta la obtención y envío de estadísticas para un país"""
         try:
             logger.info(f"Procesando país: {self.country_code}")
-            
+
             # Obtener datos de Spotify
-            country_stats = self.spotify_client.fetch_country_top_tracks(self.country_code)
-            
-            # Enviar a Kafka
+            country_stats = await self.spotify_client.fetch_country_top_tracks(self.country_code)
+
+            # Enviar a Kafka (kafka-python ya es asíncrono internamente)
             self.kafka_producer.send_country_stats(country_stats)
             
             return {
@@ -65,52 +75,70 @@ class BatchProcessCommand(Command):
         self.kafka_producer = kafka_producer
         self.country_codes = country_codes
         self.max_workers = max_workers
-    
+
+    async def _execute_async(self) -> tuple:
+        """Lanza todos los países en paralelo sobre un solo event loop"""
+        # Las peticiones son I/O puro: un semáforo acota la concurrencia
+        # sin el costo de stacks/context-switches de un pool de threads
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_limited(command: FetchCountryStatsCommand) -> Dict[str, Any]:
+            async with semaphore:
+                return await command.execute_async()
+
+        commands = [
+            FetchCountryStatsCommand(self.spotify_client, self.kafka_producer, country)
+            for country in self.country_codes
+        ]
+
+        try:
+            gathered = await asyncio.gather(
+                *(run_limited(command) for command in commands),
+                return_exceptions=True
+            )
+        finally:
+            # La sesión compartida pertenece a este event loop
+            await self.spotify_client.aclose()
+
+        # Una sola pasada con contadores: solo se retienen los fallos
+        # para diagnóstico, sin acumular los N dicts de éxito
+        successful = failed = 0
+        failures: List[Dict[str, Any]] = []
+        for result in gathered:
+            if isinstance(result, BaseException):
+                logger.error(f"Error en ejecución paralela: {result}")
+                failed += 1
+                failures.append({"status": "error", "error": str(result)})
+            elif result.get("status") == "success":
+                successful += 1
+            else:
+                failed += 1
+                failures.append(result)
+        return successful, failed, failures
+
     def execute(self) -> Dict[str, Any]:
         """Ejecuta el procesamiento en lote de países"""
-        results = []
         start_time = time.time()
-        
+
         logger.info(f"Iniciando procesamiento en lote de {len(self.country_codes)} países")
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Crear comandos para cada país
-            commands = [
-                FetchCountryStatsCommand(self.spotify_client, self.kafka_producer, country)
-                for country in self.country_codes
-            ]
-            
-            # Ejecutar comandos en paralelo
-            future_to_command = {
-                executor.submit(command.execute): command 
-                for command in commands
-            }
-            
-            for future in as_completed(future_to_command):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Error en ejecución paralela: {e}")
-                    results.append({
-                        "status": "error",
-                        "error": str(e)
-                    })
-        
+
+        successful, failed, failures = asyncio.run(self._execute_async())
+
+        # Un único flush al final del lote: junto con linger.ms los envíos
+        # por país se compactan en muy pocos requests de Produce
+        self.kafka_producer.flush(timeout=30)
+
         end_time = time.time()
         processing_time = end_time - start_time
-        
-        successful = len([r for r in results if r.get("status") == "success"])
-        failed = len([r for r in results if r.get("status") == "error"])
-        
+
         logger.info(f"Procesamiento completado - Exitosos: {successful}, Fallidos: {failed}, Tiempo: {processing_time:.2f}s")
-        
+
         return {
             "total_countries": len(self.country_codes),
             "successful": successful,
             "failed": failed,
             "processing_time_seconds": processing_time,
-            "results": results
+            "failures": failures[:10]
         }
 
 
@@ -126,11 +154,7 @@ class SpotifyProducerOrchestrator:
         self._is_initialized = False
         
         # Países por defecto para procesar
-        self.default_countries = [
-            "US", "GB", "CA", "AU", "DE", "FR", "ES", "IT", 
-            "BR", "MX", "AR", "CO", "CL", "PE", "JP", "KR", 
-            "IN", "SE", "NO"
-        ]
+        self.default_countries = list(DEFAULT_COUNTRIES)
     
     def initialize(self) -> None:
         """Inicializa todos los componentes del sistema"""
@@ -220,7 +244,7 @@ class SpotifyProducerOrchestrator:
         try:
             if self.spotify_client:
                 # Intentar obtener token (sin hacer request completo)
-                self.spotify_client.auth_strategy.get_access_token()
+                asyncio.run(self.spotify_client.auth_strategy.get_access_token())
                 health_status["spotify_auth_ok"] = True
         except Exception as e:
             health_status["spotify_auth_ok"] = False
@@ -1,8 +1,14 @@
 """
 Cliente de Spotify API usando patrón Strategy y Factory
 """
+import asyncio
 import base64
-import requests
+import math
+import time
+from types import MappingProxyType
+
+import aiohttp
+import msgspec
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from loguru import logger
@@ -10,64 +16,175 @@ from loguru import logger
 from .models import SpotifyTrack, SpotifyCountryStats
 from .config import config
 
+# orjson decodifica los payloads de Spotify ~3x más rápido que el json
+# estándar; si no está instalado se degrada limpiamente
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# URLs precalculadas: la de búsqueda es constante y la plantilla de
+# tracks se parsea una sola vez (format es más barato que re-armar el
+# f-string en cada request)
+_SEARCH_URL = "https://api.spotify.com/v1/search"
+_PLAYLIST_TRACKS_TMPL = "https://api.spotify.com/v1/playlists/{}/tracks"
+
+# Nombres de países soportados: constante de módulo (solo lectura) en
+# lugar de reconstruir el dict en cada instancia del cliente
+_COUNTRY_NAMES = MappingProxyType({
+    "US": "United States", "GB": "United Kingdom", "CA": "Canada",
+    "AU": "Australia", "DE": "Germany", "FR": "France", "ES": "Spain",
+    "IT": "Italy", "BR": "Brazil", "MX": "Mexico", "AR": "Argentina",
+    "CO": "Colombia", "CL": "Chile", "PE": "Peru", "JP": "Japan",
+    "KR": "South Korea", "IN": "India", "SE": "Sweden", "NO": "Norway"
+})
+
+# IDs de las playlists editoriales "Top 50" de Spotify por país: cambian
+# muy rara vez, así que tenerlas precargadas evita el /search y deja el
+# caso común en un solo round-trip; los códigos que no estén aquí (o
+# cuya playlist desaparezca) siguen cayendo al /search
+_CURATED_PLAYLIST_IDS = MappingProxyType({
+    "US": "37i9dQZEVXbLRQDuF5jeBp", "GB": "37i9dQZEVXbLnolsZ8PSNw",
+    "CA": "37i9dQZEVXbKj23U1GF4IR", "AU": "37i9dQZEVXbJPcfkRz0wJ0",
+    "DE": "37i9dQZEVXbJiZcmkrIHGU", "FR": "37i9dQZEVXbIPWwFssbupI",
+    "ES": "37i9dQZEVXbNFJfN1Vw8d9", "IT": "37i9dQZEVXbIQnj7RRhdSX",
+    "BR": "37i9dQZEVXbMXbN3EUUhlg", "MX": "37i9dQZEVXbO3qyFxbkOE1",
+    "AR": "37i9dQZEVXbMMy2roB9myp", "CO": "37i9dQZEVXbOa2lmxNORXQ",
+    "CL": "37i9dQZEVXbL0GavIqMTeb", "PE": "37i9dQZEVXbJfdy5b0KP7W",
+    "JP": "37i9dQZEVXbKXQ4mDTEBXq", "KR": "37i9dQZEVXbNxXF4SkHj9F",
+    "IN": "37i9dQZEVXbLZ52XmnySJg", "SE": "37i9dQZEVXbLoATJ81JYXz",
+    "NO": "37i9dQZEVXbJvfa0Yxg7E7"
+})
+
+# Esquema tipado de la respuesta de /playlists/{id}/tracks: msgspec
+# decodifica bytes -> structs en una sola pasada a nivel C, sin el dict
+# intermedio ni los .get() encadenados del parseo manual; los defaults
+# cubren los campos que falten en payloads malformados
+
+
+class _ArtistMsg(msgspec.Struct):
+    name: str = "Unknown Artist"
+
+
+class _AlbumMsg(msgspec.Struct):
+    name: str = "Unknown Album"
+
+
+class _TrackMsg(msgspec.Struct):
+    id: Optional[str] = None
+    name: str = "Unknown Track"
+    artists: List[_ArtistMsg] = []
+    album: _AlbumMsg = msgspec.field(default_factory=_AlbumMsg)
+    popularity: int = 0
+    duration_ms: int = 0
+    explicit: bool = False
+    preview_url: Optional[str] = None
+
+
+class _PlaylistItemMsg(msgspec.Struct):
+    track: Optional[_TrackMsg] = None
+
+
+class _PlaylistTracksMsg(msgspec.Struct):
+    total: int = 0
+    items: List[_PlaylistItemMsg] = []
+
+
+# Decoder cacheado a nivel de módulo: el esquema se compila una sola vez
+_TRACKS_DECODER = msgspec.json.Decoder(_PlaylistTracksMsg)
+
 
 class SpotifyAuthStrategy(ABC):
     """Estrategia abstracta para autenticación con Spotify"""
-    
+
     @abstractmethod
-    def get_access_token(self) -> str:
-        """Obtiene el token de acceso"""
+    async def get_access_token(self, session: Optional[aiohttp.ClientSession] = None) -> str:
+        """Obtiene el token de acceso, reutilizando la sesión dada si hay"""
         pass
 
 
 class ClientCredentialsAuth(SpotifyAuthStrategy):
     """Implementación de autenticación Client Credentials"""
-    
+
+    # El cuerpo del POST de token es idéntico en todas las rotaciones
+    _TOKEN_DATA = {"grant_type": "client_credentials"}
+
     def __init__(self, client_id: str, client_secret: str):
         self.client_id = client_id
         self.client_secret = client_secret
-        self._access_token: Optional[str] = None
-    
-    def get_access_token(self) -> str:
-        """Obtiene token usando Client Credentials Flow"""
-        if self._access_token:
-            return self._access_token
-            
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_string.encode("utf-8")
+        # Las credenciales no cambian: el base64 del header Basic se
+        # calcula una sola vez y no en cada refresh
+        auth_bytes = f"{client_id}:{client_secret}".encode("utf-8")
         auth_base64 = base64.b64encode(auth_bytes).decode("utf-8")
-        
-        headers = {
+        self._basic_headers = {
             "Authorization": f"Basic {auth_base64}",
             "Content-Type": "application/x-www-form-urlencoded"
         }
-        
-        data = {"grant_type": "client_credentials"}
-        
+        self._access_token: Optional[str] = None
+        # El token expira (~1h): se guarda el instante de expiración con
+        # 60s de margen en lugar de cachearlo para siempre
+        self._expires_at: float = 0.0
+        # Refresh en vuelo compartido: N coroutines concurrentes con el
+        # token frío esperan el mismo POST en vez de lanzar N
+        self._refresh_task: Optional["asyncio.Task[str]"] = None
+
+    async def get_access_token(self, session: Optional[aiohttp.ClientSession] = None) -> str:
+        """Obtiene token usando Client Credentials Flow (refresh deduplicado)"""
+        if self._access_token and time.monotonic() < self._expires_at:
+            return self._access_token
+
+        if self._refresh_task is not None:
+            return await self._refresh_task
+
+        self._refresh_task = asyncio.ensure_future(self._do_refresh(session))
         try:
-            response = requests.post(
-                "https://accounts.spotify.com/api/token",
-                headers=headers,
-                data=data,
-                timeout=30
-            )
+            return await self._refresh_task
+        finally:
+            self._refresh_task = None
+
+    async def _post_token(self, session: aiohttp.ClientSession,
+                          headers: Dict[str, str], data: Dict[str, str]) -> Dict[str, Any]:
+        """POST al endpoint de cuentas usando la sesión dada"""
+        async with session.post(
+            "https://accounts.spotify.com/api/token",
+            headers=headers,
+            data=data
+        ) as response:
             response.raise_for_status()
-            
-            token_data = response.json()
+            return _json_loads(await response.read())
+
+    async def _do_refresh(self, session: Optional[aiohttp.ClientSession] = None) -> str:
+        """Ejecuta el POST de refresh contra el endpoint de cuentas"""
+        headers = self._basic_headers
+        data = self._TOKEN_DATA
+
+        try:
+            if session is not None:
+                # Reutilizar el pool keep-alive del cliente: se ahorra el
+                # handshake TCP+TLS en cada rotación de token
+                token_data = await self._post_token(session, headers, data)
+            else:
+                timeout = aiohttp.ClientTimeout(total=30)
+                async with aiohttp.ClientSession(timeout=timeout) as own_session:
+                    token_data = await self._post_token(own_session, headers, data)
+
             self._access_token = token_data["access_token"]
+            self._expires_at = time.monotonic() + token_data.get("expires_in", 3600) - 60
             logger.info("Token de acceso obtenido exitosamente")
             return self._access_token
-            
-        except requests.RequestException as e:
+
+        except aiohttp.ClientError as e:
             logger.error(f"Error obteniendo token de acceso: {e}")
             raise
 
 
 class SpotifyDataFetcher(ABC):
     """Interfaz abstracta para obtener datos de Spotify"""
-    
+
     @abstractmethod
-    def fetch_country_top_tracks(self, country_code: str, limit: int = 50) -> SpotifyCountryStats:
+    async def fetch_country_top_tracks(self, country_code: str, limit: int = 50) -> SpotifyCountryStats:
         """Obtiene las canciones más populares de un país"""
         pass
 
@@ -75,153 +192,263 @@ class SpotifyDataFetcher(ABC):
 class SpotifyAPIClient(SpotifyDataFetcher):
     """Cliente principal de la API de Spotify"""
     
-    def __init__(self, auth_strategy: SpotifyAuthStrategy):
+    def __init__(self, auth_strategy: SpotifyAuthStrategy, rate_limit: int = 10,
+                 cache_ttl_seconds: int = 900):
         self.auth_strategy = auth_strategy
         self.base_url = "https://api.spotify.com/v1"
-        self._country_names = {
-            "US": "United States", "GB": "United Kingdom", "CA": "Canada",
-            "AU": "Australia", "DE": "Germany", "FR": "France", "ES": "Spain",
-            "IT": "Italy", "BR": "Brazil", "MX": "Mexico", "AR": "Argentina",
-            "CO": "Colombia", "CL": "Chile", "PE": "Peru", "JP": "Japan",
-            "KR": "South Korea", "IN": "India", "SE": "Sweden", "NO": "Norway"
-        }
+        # Los tops por país cambian en horas: un cache TTL en memoria
+        # corta las consultas repetidas a 0 round-trips, y el cache de
+        # playlist_id permite refrescar sin repetir el /search
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._stats_cache: Dict[str, tuple] = {}
+        self._playlist_id_cache: Dict[str, str] = {}
+        # Países cuya playlist precargada devolvió 404: se saltan la
+        # tabla curada y vuelven al /search
+        self._stale_curated: set = set()
+        # Sesión HTTP compartida (keep-alive entre países); se crea
+        # perezosamente sobre el event loop activo
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Leaky bucket: cada request consume un permiso y una tarea de
+        # fondo los repone a rate_limit por segundo, evitando que el
+        # paralelismo dispare 429s de Spotify
+        self._rate_limit = rate_limit
+        self._sem: Optional[asyncio.BoundedSemaphore] = None
+        self._leak_task: Optional[asyncio.Task] = None
+        self._limiter_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Devuelve la sesión compartida, recreándola si el loop cambió"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # Connector compartido: pool keep-alive acotado y cache DNS
+            # de api.spotify.com por 5 min; timeouts granulares para no
+            # esperar los 30s totales ante un connect colgado
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=10)
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _get_limiter(self) -> asyncio.BoundedSemaphore:
+        """Devuelve el semáforo del leaky bucket, ligado al loop activo"""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._limiter_loop is not loop:
+            self._sem = asyncio.BoundedSemaphore(self._rate_limit)
+            self._leak_task = loop.create_task(self._leak())
+            self._limiter_loop = loop
+        return self._sem
+
+    async def _leak(self) -> None:
+        """Repone permisos del bucket a razón de rate_limit por segundo"""
+        interval = 1.0 / self._rate_limit
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self._sem.release()
+            except ValueError:
+                pass  # Bucket lleno
+
+    async def _throttle(self) -> None:
+        """Consume un permiso del bucket antes de lanzar un request"""
+        await self._get_limiter().acquire()
+
+    async def _get_bytes(self, url: str, **kwargs) -> bytes:
+        """GET con rate limiting y reintentos ante 429; devuelve el cuerpo crudo"""
+        session = self._get_session()
+        for attempt in range(3):
+            await self._throttle()
+            async with session.get(url, **kwargs) as response:
+                if response.status == 429 and attempt < 2:
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                    wait = retry_after * (2 ** attempt)
+                    logger.warning(f"429 de Spotify, reintentando en {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                    continue
+                response.raise_for_status()
+                return await response.read()
+
+    async def _get_json(self, url: str, **kwargs) -> Dict[str, Any]:
+        """GET que decodifica el cuerpo como JSON genérico"""
+        return _json_loads(await self._get_bytes(url, **kwargs))
+
+    async def aclose(self) -> None:
+        """Cierra la sesión HTTP compartida y detiene el rate limiter"""
+        if self._leak_task is not None and not self._leak_task.done():
+            self._leak_task.cancel()
+        self._leak_task = None
+        self._sem = None
+        self._limiter_loop = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self) -> "SpotifyAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get_headers(self) -> Dict[str, str]:
         """Obtiene headers con token de autorización"""
-        token = self.auth_strategy.get_access_token()
+        token = await self.auth_strategy.get_access_token(self._get_session())
         return {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
     
-    def _parse_track(self, track_data: Dict[str, Any]) -> SpotifyTrack:
-        """Convierte datos de track de la API a modelo SpotifyTrack"""
-        try:
-            return SpotifyTrack(
-                track_id=track_data.get("id", "unknown"),
-                name=track_data.get("name", "Unknown Track"),
-                artist=track_data.get("artists", [{}])[0].get("name", "Unknown Artist") if track_data.get("artists") else "Unknown Artist",
-                album=track_data.get("album", {}).get("name", "Unknown Album"),
-                popularity=track_data.get("popularity", 0),
-                duration_ms=track_data.get("duration_ms", 0),
-                explicit=track_data.get("explicit", False),
-                preview_url=track_data.get("preview_url")
-            )
-        except Exception as e:
-            logger.warning(f"Error parseando track data: {e}, usando valores por defecto")
-            return SpotifyTrack(
-                track_id="unknown",
-                name="Unknown Track",
-                artist="Unknown Artist", 
-                album="Unknown Album",
-                popularity=0,
-                duration_ms=0,
-                explicit=False,
-                preview_url=None
-            )
-    
-    def fetch_country_top_tracks(self, country_code: str, limit: int = 50) -> SpotifyCountryStats:
+    def _empty_stats(self, country_code: str) -> SpotifyCountryStats:
+        """Estadísticas vacías compartidas por los caminos de fallo"""
+        return SpotifyCountryStats(
+            country_code=country_code,
+            country_name=_COUNTRY_NAMES.get(country_code, country_code),
+            top_tracks=[],
+            total_tracks=0
+        )
+
+    def fetch_country_top_tracks_sync(self, country_code: str, limit: int = 50) -> SpotifyCountryStats:
+        """Versión síncrona de fetch_country_top_tracks para llamadas puntuales"""
+        async def _run() -> SpotifyCountryStats:
+            try:
+                return await self.fetch_country_top_tracks(country_code, limit)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run())
+
+    async def fetch_many(self, country_codes: List[str], limit: int = 50) -> List[Any]:
+        """
+        Obtiene las estadísticas de varios países en paralelo sobre la
+        misma sesión; las excepciones se devuelven en la posición del
+        país que falló
+        """
+        return await asyncio.gather(
+            *(self.fetch_country_top_tracks(code, limit) for code in country_codes),
+            return_exceptions=True
+        )
+
+    async def fetch_country_top_tracks(self, country_code: str, limit: int = 50) -> SpotifyCountryStats:
         """
         Obtiene las canciones más populares de un país específico
         Nota: Spotify no tiene endpoint directo para top tracks por país,
         por lo que usamos playlists populares como aproximación
         """
         try:
-            headers = self._get_headers()
-            
-            # Buscar playlists populares del país
-            search_url = f"{self.base_url}/search"
-            params = {
-                "q": f"top {country_code} hits",
-                "type": "playlist",
-                "market": country_code,
-                "limit": 1
-            }
-            
-            response = requests.get(search_url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            
-            search_data = response.json()
-            playlists = search_data.get("playlists", {})
-            
-            if not playlists or not playlists.get("items"):
-                logger.warning(f"No se encontraron playlists para {country_code}")
-                return SpotifyCountryStats(
-                    country_code=country_code,
-                    country_name=self._country_names.get(country_code, country_code),
-                    top_tracks=[],
-                    total_tracks=0
-                )
-            
-            playlist_items = playlists.get("items", [])
-            if not playlist_items:
-                logger.warning(f"Lista de playlists vacía para {country_code}")
-                return SpotifyCountryStats(
-                    country_code=country_code,
-                    country_name=self._country_names.get(country_code, country_code),
-                    top_tracks=[],
-                    total_tracks=0
-                )
-            
-            # Obtener tracks de la primera playlist
-            playlist_id = playlist_items[0].get("id")
-            if not playlist_id:
-                logger.warning(f"No se pudo obtener ID de playlist para {country_code}")
-                return SpotifyCountryStats(
-                    country_code=country_code,
-                    country_name=self._country_names.get(country_code, country_code),
-                    top_tracks=[],
-                    total_tracks=0
-                )
-            
-            tracks_url = f"{self.base_url}/playlists/{playlist_id}/tracks"
+            # Resultado reciente en cache: 0 round-trips
+            cached = self._stats_cache.get(country_code)
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl_seconds:
+                # Formateo perezoso: no se arma el string si el nivel
+                # DEBUG/INFO está filtrado en el sink
+                logger.opt(lazy=True).debug("Cache hit para {}", lambda: country_code)
+                return cached[1]
+
+            headers = await self._get_headers()
+
+            playlist_id = self._playlist_id_cache.get(country_code)
+            if playlist_id is None and country_code not in self._stale_curated:
+                # Playlist editorial conocida: se salta el /search
+                playlist_id = _CURATED_PLAYLIST_IDS.get(country_code)
+            if playlist_id is None:
+                # Buscar playlists populares del país
+                params = {
+                    "q": f"top {country_code} hits",
+                    "type": "playlist",
+                    "market": country_code,
+                    "limit": 1,
+                    # Solo se usa items[0].id: proyectar el resto reduce
+                    # ~20x el payload a decodificar
+                    "fields": "playlists.items(id,name)"
+                }
+
+                search_data = await self._get_json(_SEARCH_URL, headers=headers, params=params)
+
+                # Guardia única: sin playlists, lista vacía o item sin id
+                playlist_items = search_data.get("playlists", {}).get("items")
+                if not playlist_items:
+                    logger.warning(f"No se encontraron playlists para {country_code}")
+                    return self._empty_stats(country_code)
+
+                # Obtener tracks de la primera playlist
+                playlist_id = playlist_items[0].get("id")
+                if not playlist_id:
+                    logger.warning(f"No se pudo obtener ID de playlist para {country_code}")
+                    return self._empty_stats(country_code)
+                self._playlist_id_cache[country_code] = playlist_id
+
+            tracks_url = _PLAYLIST_TRACKS_TMPL.format(playlist_id)
             tracks_params = {
                 "market": country_code,
                 "limit": min(limit, 50),
-                "fields": "items(track(id,name,artists,album,popularity,duration_ms,explicit,preview_url))"
+                "fields": "total,items(track(id,name,artists,album,popularity,duration_ms,explicit,preview_url))"
             }
-            
-            tracks_response = requests.get(tracks_url, headers=headers, params=tracks_params, timeout=30)
-            tracks_response.raise_for_status()
-            
-            tracks_data = tracks_response.json()
+
+            raw_page = await self._get_bytes(tracks_url, headers=headers, params=tracks_params)
+            tracks_data = _TRACKS_DECODER.decode(raw_page)
+            items = tracks_data.items
+
+            if limit > 50:
+                # Paginación en paralelo: los offsets restantes salen
+                # todos a la vez (acotados por el leaky bucket), así el
+                # tiempo total escala con el RTT y no con las páginas
+                total = min(tracks_data.total or len(items), limit)
+                offsets = [50 * n for n in range(1, math.ceil(total / 50))]
+                if offsets:
+                    pages = await asyncio.gather(*(
+                        self._get_bytes(tracks_url, headers=headers,
+                                        params={**tracks_params, "offset": offset})
+                        for offset in offsets
+                    ))
+                    for raw in pages:
+                        items.extend(_TRACKS_DECODER.decode(raw).items)
+                    items = items[:limit]
+
             tracks = []
-            
-            for item in tracks_data.get("items", []):
-                track_info = item.get("track")
-                if track_info and track_info.get("id"):  # Verificar que el track existe
-                    try:
-                        track = self._parse_track(track_info)
-                        tracks.append(track)
-                    except Exception as e:
-                        logger.warning(f"Error parseando track: {e}")
-                        continue
-            
-            logger.info(f"Obtenidos {len(tracks)} tracks para {country_code}")
-            
-            return SpotifyCountryStats(
+            # Aliases locales: evitan el lookup de atributo/global por
+            # iteración en el bucle más caliente del cliente
+            tracks_append = tracks.append
+            make_track = SpotifyTrack
+
+            for item in items:
+                track_info = item.track
+                if track_info is not None and track_info.id:  # Verificar que el track existe
+                    artists = track_info.artists
+                    tracks_append(make_track(
+                        track_id=track_info.id,
+                        name=track_info.name,
+                        artist=artists[0].name if artists else "Unknown Artist",
+                        album=track_info.album.name,
+                        popularity=track_info.popularity,
+                        duration_ms=track_info.duration_ms,
+                        explicit=track_info.explicit,
+                        preview_url=track_info.preview_url
+                    ))
+
+            logger.opt(lazy=True).info("Obtenidos {} tracks para {}",
+                                       lambda: len(tracks), lambda: country_code)
+
+            stats = SpotifyCountryStats(
                 country_code=country_code,
-                country_name=self._country_names.get(country_code, country_code),
+                country_name=_COUNTRY_NAMES.get(country_code, country_code),
                 top_tracks=tracks,
                 total_tracks=len(tracks)
             )
-            
-        except requests.RequestException as e:
+            self._stats_cache[country_code] = (time.monotonic(), stats)
+            return stats
+
+        except aiohttp.ClientError as e:
+            if isinstance(e, aiohttp.ClientResponseError) and e.status == 404:
+                # La playlist precargada/cacheada ya no existe: se
+                # invalida para que el próximo intento vuelva al /search
+                self._playlist_id_cache.pop(country_code, None)
+                self._stale_curated.add(country_code)
             logger.error(f"Error de request para {country_code}: {e}")
-            return SpotifyCountryStats(
-                country_code=country_code,
-                country_name=self._country_names.get(country_code, country_code),
-                top_tracks=[],
-                total_tracks=0
-            )
+            return self._empty_stats(country_code)
         except Exception as e:
             logger.error(f"Error inesperado para {country_code}: {e}")
-            return SpotifyCountryStats(
-                country_code=country_code,
-                country_name=self._country_names.get(country_code, country_code),
-                top_tracks=[],
-                total_tracks=0
-            )
+            return self._empty_stats(country_code)
 
 
 class SpotifyClientFactory:
@@ -234,4 +461,4 @@ class SpotifyClientFactory:
             client_id=config.spotify_client_id,
             client_secret=config.spotify_client_secret
         )
-        return SpotifyAPIClient(auth_strategy)
+        return SpotifyAPIClient(auth_strategy, rate_limit=config.spotify_rate_limit)